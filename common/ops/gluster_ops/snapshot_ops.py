@@ -3,10 +3,46 @@ This file contains one class - SnapshotOps wich holds
 operations on the enable, disable the features.uss option,
 check for snapd process.
 """
+# pylint: disable=too-many-lines
+
 import copy
+import json
+import time
+import concurrent.futures
+from typing import Optional
+import xmltodict
 from common.ops.abstract_ops import AbstractOps
 
 
+# Command templates of the snapshot ops.
+_CMD_USS_SET = "gluster volume set {vol} features.uss {state} --mode=script"
+_CMD_SNAP_CREATE = ("gluster snapshot create {snap} {vol} {tstamp} {desc}"
+                    " {force} --mode=script --xml")
+_CMD_SNAP_CLONE = "gluster snapshot clone {clone} {snap} --mode=script --xml"
+_CMD_SNAP_RESTORE = "gluster snapshot restore {snap} --mode=script --xml"
+_CMD_VOL_STOP_FORCE = "gluster volume stop {vol} force --mode=script --xml"
+_CMD_VOL_START_FORCE = "gluster volume start {vol} force --mode=script --xml"
+_CMD_SNAP_STATUS = {
+    "snap": "gluster snapshot status {snap} --mode=script --xml",
+    "vol": "gluster snapshot status volume {vol} --mode=script --xml"
+}
+_CMD_SNAP_STATUS_VOL_TEXT = ("gluster snapshot status volume {vol}"
+                             " --mode=script")
+_CMD_SNAP_INFO = {
+    "snap": "gluster snapshot info {snap} --mode=script --xml",
+    "vol": "gluster snapshot info volume {vol} --xml --mode=script"
+}
+_CMD_SNAP_LIST_VOL = "gluster snapshot list {vol} --xml --mode=script"
+_CMD_SNAP_DELETE = "gluster snapshot delete {snap} --xml --mode=script"
+_CMD_SNAP_DELETE_VOL = ("gluster snapshot delete volume {vol} --xml"
+                        " --mode=script")
+_CMD_SNAP_ACTIVATE = ("gluster snapshot activate {snap} {force}"
+                      " --mode=script --xml")
+_CMD_SNAP_DEACTIVATE = "gluster snapshot deactivate {snap} --mode=script --xml"
+_CMD_SNAP_CONFIG_SET = ("gluster snapshot config {vol} {opt} {val}"
+                        " --mode=script --xml")
+
+
 # pylint: disable=assignment-from-none,unsubscriptable-object,not-an-iterable
 
 class SnapshotOps(AbstractOps):
@@ -15,6 +51,183 @@ class SnapshotOps(AbstractOps):
     the features.uss option, check for snapd process.
     """
 
+    _BATCH_MARKER = "__REDANT_BATCH_END__"
+    _QUERY_CACHE_TTL = 2.0
+
+    def _exec_batch(self, cmds: list, excep: bool = True,
+                    stop_on_error: bool = False) -> list:
+        """
+        Executes a set of commands with a single exec per node instead of
+        one exec per command. The commands of a node are run sequentially
+        in the given order and the combined output is split back per
+        command.
+
+        Args:
+            cmds (list): List of (cmd, node) tuples.
+        Optional:
+            excep (bool): exception flag to bypass the exception if any of
+                          the commands fail. If set to False the exception
+                          is bypassed and the values are returned.
+                          Defaults to True
+            stop_on_error (bool): If True, the remaining commands of a
+                                  node aren't run once a command exits
+                                  with a non zero status or, for --xml
+                                  commands, reports a non zero opRet.
+                                  Defaults to False
+
+        Returns:
+            list: A ret dictionary per command, in the order of cmds,
+                  consisting
+                - Flag : Flag to check if connection failed
+                - msg : message
+                - error_msg: error message
+                - error_code: error code returned
+                - cmd : command that got executed
+                - node : node on which the command got executed
+        """
+        node_cmds = {}
+        for (index, (cmd, node)) in enumerate(cmds):
+            self.logger.info(f"Running {cmd} on {node}")
+            node_cmds.setdefault(node, []).append((index, cmd))
+
+        # Dispatch the batch to all the nodes before collecting any.
+        cmd_tail = (f"echo \"{self._BATCH_MARKER} $rc\"; "
+                    f"echo {self._BATCH_MARKER} >&2")
+
+        def _script_step(cmd):
+            if not stop_on_error:
+                return f"{cmd}; rc=$?; {cmd_tail}"
+            # Gluster reports the xml command failures through opRet with
+            # a zero exit status, hence the output is checked as well.
+            step = (f"out=$({cmd}); rc=$?; [ -n \"$out\" ] && "
+                    f"printf '%s\\n' \"$out\"; {cmd_tail}; "
+                    "[ $rc -eq 0 ] || exit $rc")
+            if cmd.find("--xml") != -1:
+                step = (f"{step}; case \"$out\" in "
+                        "*'<opRet>0</opRet>'*) ;; *) exit 1;; esac")
+            return step
+
+        async_objs = {}
+        for (node, index_cmds) in node_cmds.items():
+            script = "; ".join(_script_step(cmd) for (_, cmd) in index_cmds)
+            async_objs[node] = self.execute_command_async(script, node)
+
+        ret_list = [None] * len(cmds)
+        for (node, index_cmds) in node_cmds.items():
+            async_obj = async_objs[node]
+            if not async_obj:
+                for (index, cmd) in index_cmds:
+                    ret_list[index] = {'Flag': False, 'msg': [],
+                                       'error_msg': "Connection failed",
+                                       'error_code': -1, 'cmd': cmd,
+                                       'node': node}
+                continue
+
+            # The marker can trail the last line of a command's output
+            # if that isn't newline terminated.
+            out_chunks = [[]]
+            ret_codes = []
+            for line in async_obj['stdout'].readlines():
+                pos = line.find(self._BATCH_MARKER)
+                if pos == -1:
+                    out_chunks[-1].append(line)
+                    continue
+                if pos:
+                    out_chunks[-1].append(line[:pos])
+                ret_codes.append(
+                    int(line[pos + len(self._BATCH_MARKER):].split()[0]))
+                out_chunks.append([])
+            err_chunks = [[]]
+            for line in async_obj['stderr'].readlines():
+                pos = line.find(self._BATCH_MARKER)
+                if pos == -1:
+                    err_chunks[-1].append(line)
+                    continue
+                if pos:
+                    err_chunks[-1].append(line[:pos])
+                err_chunks.append([])
+
+            for (pos, (index, cmd)) in enumerate(index_cmds):
+                ret = {'node': node, 'cmd': cmd}
+                if pos >= len(ret_codes):
+                    # The batch got stopped before this command.
+                    ret.update({'Flag': False, 'msg': [],
+                                'error_msg': "Command execution incomplete",
+                                'error_code': -1})
+                elif ret_codes[pos] != 0:
+                    ret.update({'Flag': False, 'msg': out_chunks[pos],
+                                'error_msg': "".join(err_chunks[pos]),
+                                'error_code': ret_codes[pos]})
+                else:
+                    if cmd.find("--xml") != -1:
+                        ret['msg'] = json.loads(json.dumps(xmltodict.parse(
+                            "".join(out_chunks[pos]))))['cliOutput']
+                    else:
+                        ret['msg'] = out_chunks[pos]
+                    ret.update({'Flag': True, 'error_code': 0})
+                self.logger.debug(ret)
+                ret_list[index] = ret
+
+        if not excep:
+            return ret_list
+
+        for ret in ret_list:
+            if ret['error_code'] != 0:
+                self.logger.error(ret['error_msg'])
+                raise Exception(ret['error_msg'])
+            elif isinstance(ret['msg'], dict):
+                if int(ret['msg']['opRet']) != 0:
+                    self.logger.error(ret['msg']['opErrstr'])
+                    raise Exception(ret['msg']['opErrstr'])
+
+        return ret_list
+
+    def _get_cached(self, key: tuple, fetch_fn, copy_result: bool = True):
+        """
+        Returns the cached result of a query if it was fetched within the
+        TTL and no other command was run since, else fetches it again.
+        Note that a polling loop which runs no other command between the
+        calls sees results up to _QUERY_CACHE_TTL seconds old.
+
+        Args:
+            key (tuple): Key identifying the query.
+            fetch_fn (function): Function to run the query.
+        Optional:
+            copy_result (bool): If False, the cached object itself is
+                                returned, which the caller must not modify.
+                                Defaults to True
+
+        Returns:
+            The result of fetch_fn.
+        """
+        entry = self._query_cache.get(key)
+        if (entry is not None and entry[0] == self._op_seq
+                and time.monotonic() - entry[1] < self._QUERY_CACHE_TTL):
+            return copy.deepcopy(entry[2]) if copy_result else entry[2]
+
+        value = fetch_fn()
+        self._query_cache[key] = (self._op_seq, time.monotonic(),
+                                  copy.deepcopy(value) if copy_result
+                                  else value)
+        return value
+
+    def _get_uss_option(self, volname: str, node: str) -> dict:
+        """
+        Cached lookup of the uss option of a volume.
+        """
+        return self._get_cached(
+            (volname, node, "uss"),
+            lambda: self.get_volume_options(volname, "uss", node, False))
+
+    def _get_vol_status_cached(self, volname: str, node: str,
+                               excep: bool = True) -> dict:
+        """
+        Cached lookup of the volume status.
+        """
+        return self._get_cached(
+            (volname, node, "status", excep),
+            lambda: self.get_volume_status(volname, node, excep=excep))
+
     def enable_uss(self, volname: str, node: str,
                    excep: bool = True) -> dict:
         """
@@ -38,7 +251,7 @@ class SnapshotOps(AbstractOps):
                 - cmd : command that got executed
                 - node : node on which the command got executed
         """
-        cmd = f"gluster volume set {volname} features.uss enable --mode=script"
+        cmd = _CMD_USS_SET.format(vol=volname, state="enable")
         ret = self.execute_abstract_op_node(cmd, node, excep)
         return ret
 
@@ -65,37 +278,32 @@ class SnapshotOps(AbstractOps):
                 - cmd : command that got executed
                 - node : node on which the command got executed
         """
-        cmd = (f"gluster volume set {volname} features.uss disable"
-               " --mode=script")
+        cmd = _CMD_USS_SET.format(vol=volname, state="disable")
         ret = self.execute_abstract_op_node(cmd, node, excep)
         return ret
 
-    def is_uss_enabled(self, volname: str, node: str) -> bool:
+    def _uss_state(self, volname: str, node: str) -> Optional[str]:
         """
-        Check if uss is Enabled on the specified volume
+        Obtain the uss state of the specified volume
 
         Args:
             volname (str): volume name
             node (str): Node on which cmd has to be executed.
 
         Returns:
-            bool : True if successfully enabled uss on the volume.
-                   False otherwise.
+            str : value of features.uss, i.e. 'enable' or 'disable'.
+                  None if it couldn't be obtained.
         """
-        option_dict = self.get_volume_options(volname, "uss", node, False)
+        option_dict = self._get_uss_option(volname, node)
         if not option_dict:
             self.logger.error(f"USS is not set on the volume {volname}")
-            return False
-
-        if ('features.uss' in option_dict
-                and option_dict['features.uss'] == 'enable'):
-            return True
+            return None
 
-        return False
+        return option_dict.get('features.uss')
 
-    def is_uss_disabled(self, volname: str, node: str) -> bool:
+    def is_uss_enabled(self, volname: str, node: str) -> bool:
         """
-        Check if uss is Disabled on the specified volume
+        Check if uss is Enabled on the specified volume
 
         Args:
             volname (str): volume name
@@ -105,16 +313,21 @@ class SnapshotOps(AbstractOps):
             bool : True if successfully enabled uss on the volume.
                    False otherwise.
         """
-        option_dict = self.get_volume_options(volname, "uss", node, False)
-        if not option_dict:
-            self.logger.error(f"USS is not set on the volume {volname}")
-            return False
+        return self._uss_state(volname, node) == 'enable'
 
-        if ('features.uss' in option_dict
-                and option_dict['features.uss'] == 'disable'):
-            return True
+    def is_uss_disabled(self, volname: str, node: str) -> bool:
+        """
+        Check if uss is Disabled on the specified volume
+
+        Args:
+            volname (str): volume name
+            node (str): Node on which cmd has to be executed.
 
-        return False
+        Returns:
+            bool : True if successfully disabled uss on the volume.
+                   False otherwise.
+        """
+        return self._uss_state(volname, node) == 'disable'
 
     def uss_list_snaps(self, client: str, mount: str,
                        recursive: bool = True,
@@ -159,7 +372,7 @@ class SnapshotOps(AbstractOps):
         Returns:
             bool: True on success, False otherwise
         """
-        vol_status = self.get_volume_status(volname, node, excep=excep)
+        vol_status = self._get_vol_status_cached(volname, node, excep)
 
         if vol_status is None:
             self.logger.error("Failed to get volume status in "
@@ -235,8 +448,9 @@ class SnapshotOps(AbstractOps):
         if force:
             frce = 'force'
 
-        cmd = (f"gluster snapshot create {snapname} {volname}"
-               f" {tstamp} {description} {frce} --mode=script --xml")
+        cmd = _CMD_SNAP_CREATE.format(snap=snapname, vol=volname,
+                                      tstamp=tstamp, desc=description,
+                                      force=frce)
 
         return self.execute_abstract_op_node(cmd, node, excep)
 
@@ -265,8 +479,7 @@ class SnapshotOps(AbstractOps):
                 - cmd : command that got executed
                 - node : node on which the command got executed
         """
-        cmd = (f"gluster snapshot clone {clonename} {snapname} --mode=script"
-               " --xml")
+        cmd = _CMD_SNAP_CLONE.format(clone=clonename, snap=snapname)
         ret = self.execute_abstract_op_node(cmd, node, excep)
         if not excep and ret['msg']['opRet'] != '0':
             return ret
@@ -318,7 +531,7 @@ class SnapshotOps(AbstractOps):
                 - cmd : command that got executed
                 - node : node on which the command got executed
         """
-        cmd = (f"gluster snapshot restore {snapname} --mode=script --xml")
+        cmd = _CMD_SNAP_RESTORE.format(snap=snapname)
         return self.execute_abstract_op_node(cmd, node, excep)
 
     def snap_restore_complete(self, volname: str, snapname: str,
@@ -340,20 +553,26 @@ class SnapshotOps(AbstractOps):
         Returns:
             bool: True if restore is a success or False.
         """
-        # Stop the volume.
-        ret = self.volume_stop(volname, node, force=True, excep=excep)
-        if not excep and ret['msg']['opRet'] != '0':
-            return False
-
-        ret = self.snap_restore(snapname, node, excep)
-
-        if not excep and ret['msg']['opRet'] != '0':
-            return False
-
-        # Start the volume
-        ret = self.volume_start(volname, node, force=True, excep=excep)
-        if not excep and ret['msg']['opRet'] != '0':
-            return False
+        # Stop the volume, restore the snapshot and start the volume again,
+        # all in a single exec.
+        cmds = [(_CMD_VOL_STOP_FORCE.format(vol=volname), node),
+                (_CMD_SNAP_RESTORE.format(snap=snapname), node),
+                (_CMD_VOL_START_FORCE.format(vol=volname), node)]
+        ret_list = self._exec_batch(cmds, False, stop_on_error=True)
+
+        for (ret, vol_started) in zip(ret_list, (False, None, True)):
+            if ret['error_code'] != 0:
+                if excep:
+                    self.logger.error(ret['error_msg'])
+                    raise Exception(ret['error_msg'])
+                return False
+            if ret['msg']['opRet'] != '0':
+                if excep:
+                    self.logger.error(ret['msg']['opErrstr'])
+                    raise Exception(ret['msg']['opErrstr'])
+                return False
+            if vol_started is not None:
+                self.es.set_volume_start_status(volname, vol_started)
 
         return True
 
@@ -381,13 +600,12 @@ class SnapshotOps(AbstractOps):
                 - cmd : command that got executed
                 - node : node on which the command got executed
         """
-        if snapname is None and volname is None:
-            raise Exception("Provide either snapname or volume name.")
-        elif snapname is not None:
-            cmd = (f"gluster snapshot status {snapname} --mode=script --xml")
+        if snapname is not None:
+            cmd = _CMD_SNAP_STATUS["snap"].format(snap=snapname)
         elif volname is not None:
-            cmd = (f"gluster snapshot status volume {volname} --mode=script"
-                   " --xml")
+            cmd = _CMD_SNAP_STATUS["vol"].format(vol=volname)
+        else:
+            raise Exception("Provide either snapname or volume name.")
         return self.execute_abstract_op_node(cmd, node, excep)
 
     def get_snap_status(self, node: str, excep: bool = True) -> dict:
@@ -406,6 +624,21 @@ class SnapshotOps(AbstractOps):
             Dict of snapshot statuses parsed and packaged properly and
             in case of excep being false, the raw response.
         """
+        return copy.deepcopy(self._snap_status_index(node, excep))
+
+    def _snap_status_index(self, node: str, excep: bool = True) -> dict:
+        """
+        Cached snapshot status by snapname, shared between the lookups
+        hence not to be modified.
+        """
+        return self._get_cached((node, "snap_status", excep),
+                                lambda: self._get_snap_status(node, excep),
+                                False)
+
+    def _get_snap_status(self, node: str, excep: bool = True) -> dict:
+        """
+        Runs and parses the snapshot status, see get_snap_status.
+        """
         cmd = "gluster snapshot status --xml --mode=script"
         ret = self.execute_abstract_op_node(cmd, node)
         ret = ret['msg']['snapStatus']['snapshots']['snapshot']
@@ -443,11 +676,8 @@ class SnapshotOps(AbstractOps):
             Dictionary of the snap status for the said snapshot or Nonetype
             object.
         """
-        snap_status_dict = self.get_snap_status(node, excep)
-
-        if snapname in snap_status_dict.keys():
-            return snap_status_dict[snapname]
-        return None
+        snap_status_dict = self._snap_status_index(node, excep)
+        return copy.deepcopy(snap_status_dict.get(snapname))
 
     def get_snap_status_by_volname(self, volname: str, node: str,
                                    excep: bool = True) -> dict:
@@ -467,7 +697,7 @@ class SnapshotOps(AbstractOps):
             Dictionary of the snap status for the said volume or Nonetype
             object.
         """
-        cmd = f"gluster snapshot status volume {volname} --mode=script"
+        cmd = _CMD_SNAP_STATUS_VOL_TEXT.format(vol=volname)
         ret = self.execute_abstract_op_node(cmd, node, excep)
         if not excep:
             return ret
@@ -499,13 +729,12 @@ class SnapshotOps(AbstractOps):
                 - cmd : command that got executed
                 - node : node on which the command got executed
         """
-        if snapname is None and volname is None:
-            raise Exception("Provide either snapname or volname.")
-        elif snapname is not None:
-            cmd = (f"gluster snapshot info {snapname} --mode=script --xml")
+        if snapname is not None:
+            cmd = _CMD_SNAP_INFO["snap"].format(snap=snapname)
         elif volname is not None:
-            cmd = (
-                f"gluster snapshot info volume {volname} --xml --mode=script")
+            cmd = _CMD_SNAP_INFO["vol"].format(vol=volname)
+        else:
+            raise Exception("Provide either snapname or volname.")
         return self.execute_abstract_op_node(cmd, node, excep)
 
     def get_snap_info(self, node: str, excep: bool = True) -> dict:
@@ -524,6 +753,21 @@ class SnapshotOps(AbstractOps):
         Returns:
             ret: A dict in case of valid data or else NoneType value.
         """
+        return copy.deepcopy(self._snap_info_index(node, excep))
+
+    def _snap_info_index(self, node: str, excep: bool = True) -> dict:
+        """
+        Cached snapshot info by snapname, shared between the lookups
+        hence not to be modified.
+        """
+        return self._get_cached((node, "snap_info", excep),
+                                lambda: self._get_snap_info(node, excep),
+                                False)
+
+    def _get_snap_info(self, node: str, excep: bool = True) -> dict:
+        """
+        Runs and parses the snapshot info, see get_snap_info.
+        """
         cmd = "gluster snapshot info --xml --mode=script"
         ret = self.execute_abstract_op_node(cmd, node, excep)
 
@@ -561,14 +805,11 @@ class SnapshotOps(AbstractOps):
         Returns:
             dictionary of the snap info or Nonetype object.
         """
-        snap_info_dict = self.get_snap_info(node, excep)
+        snap_info_dict = self._snap_info_index(node, excep)
 
         if snap_info_dict is None:
             return None
-        if snapname in snap_info_dict.keys():
-            return snap_info_dict[snapname]
-        else:
-            return None
+        return copy.deepcopy(snap_info_dict.get(snapname))
 
     def get_snap_info_by_volname(self, volname: str, node: str,
                                  excep: bool = True) -> dict:
@@ -587,7 +828,7 @@ class SnapshotOps(AbstractOps):
         Returns:
             dictionary of the snap info or Nonetype object.
         """
-        snap_info_dict = self.get_snap_info(node, excep)
+        snap_info_dict = self._snap_info_index(node, excep)
         if snap_info_dict is None:
             return None
 
@@ -653,11 +894,19 @@ class SnapshotOps(AbstractOps):
                - node: node on which the command got executed.
               when excep is False or else we return list of snapshots.
         """
+        return self._get_cached(
+            (node, "snap_list", volname, excep),
+            lambda: self._get_snap_list(node, volname, excep))
+
+    def _get_snap_list(self, node: str, volname: str = None,
+                       excep: bool = True) -> list:
+        """
+        Runs and parses the snapshot list, see get_snap_list.
+        """
         if volname is None:
             cmd = "gluster snapshot list --xml --mode=script"
         else:
-            cmd = (f"gluster snapshot list {volname} --xml"
-                   " --mode=script")
+            cmd = _CMD_SNAP_LIST_VOL.format(vol=volname)
 
         ret = self.execute_abstract_op_node(cmd, node, excep)
 
@@ -695,9 +944,73 @@ class SnapshotOps(AbstractOps):
                 - cmd : command that got executed
                 - node : node on which the command got executed
         """
-        cmd = (f"gluster snapshot delete {snapname} --xml --mode=script")
+        cmd = _CMD_SNAP_DELETE.format(snap=snapname)
         return self.execute_abstract_op_node(cmd, node, excep)
 
+    def snap_delete_many(self, snapnames: list, node: str,
+                         max_concurrency: int = 8,
+                         excep: bool = True) -> list:
+        """
+        Method to delete a set of snapshots in one go. The snapshots are
+        grouped by their origin volume, each group is deleted sequentially
+        in a single exec and the groups are deleted in parallel, as glusterd
+        doesn't allow concurrent transactions on the same volume.
+
+        Args:
+            snapnames (list): names of the snapshots.
+            node (str): Node wherein the commands are to be executed.
+
+        Optional:
+            max_concurrency (int): Maximum number of groups being deleted
+            in parallel. Defaults to 8.
+            excep (bool): Flag to control exception handling by the
+            abstract ops. If True, the exception is handled, or else
+            it isn't.
+
+        Returns:
+            list: A ret dictionary per snapshot, in the order of snapnames,
+            consisting
+                - Flag : Flag to check if connection failed
+                - msg : message
+                - error_msg: error message
+                - error_code: error code returned
+                - cmd : command that got executed
+                - node : node on which the command got executed
+        """
+        if not snapnames:
+            return []
+
+        # Failures are left to be reported by the delete commands, the
+        # snapshots then fall into a single group. The info parsing fails
+        # with a TypeError when the cluster has no snapshots.
+        try:
+            snap_info_dict = self._snap_info_index(node, False)
+        except (TypeError, KeyError):
+            snap_info_dict = {}
+        if not isinstance(snap_info_dict, dict) or 'msg' in snap_info_dict:
+            snap_info_dict = {}
+
+        vol_snaps = {}
+        for snapname in snapnames:
+            snap_vol = snap_info_dict.get(snapname, {}).get('snapVolume', {})
+            volname = snap_vol.get('originVolume', {}).get('name')
+            vol_snaps.setdefault(volname, []).append(snapname)
+
+        snap_groups = list(vol_snaps.values())
+        cmd_groups = [[(_CMD_SNAP_DELETE.format(snap=snapname), node)
+                       for snapname in snap_group]
+                      for snap_group in snap_groups]
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(1, min(max_concurrency,
+                                       len(cmd_groups)))) as executor:
+            ret_groups = list(executor.map(
+                lambda cmds: self._exec_batch(cmds, excep), cmd_groups))
+
+        snap_rets = {}
+        for (snap_group, ret_group) in zip(snap_groups, ret_groups):
+            snap_rets.update(zip(snap_group, ret_group))
+        return [snap_rets[snapname] for snapname in snapnames]
+
     def snap_delete_by_volumename(self, volname: str, node: str,
                                   excep: bool = True) -> dict:
         """
@@ -721,7 +1034,7 @@ class SnapshotOps(AbstractOps):
                 - cmd : command that got executed
                 - node : node on which the command got executed
         """
-        cmd = (f"gluster snapshot delete volume {volname} --xml --mode=script")
+        cmd = _CMD_SNAP_DELETE_VOL.format(vol=volname)
         return self.execute_abstract_op_node(cmd, node, excep)
 
     def snap_delete_all(self, node: str, excep: bool = True) -> dict:
@@ -779,8 +1092,7 @@ class SnapshotOps(AbstractOps):
         if force:
             frce = 'force'
 
-        cmd = (f"gluster snapshot activate {snapname} {frce}"
-               " --mode=script --xml")
+        cmd = _CMD_SNAP_ACTIVATE.format(snap=snapname, force=frce)
         return self.execute_abstract_op_node(cmd, node, excep)
 
     def snap_deactivate(self, snapname: str, node: str,
@@ -806,7 +1118,7 @@ class SnapshotOps(AbstractOps):
                 - cmd : command that got executed
                 - node : node on which the command got executed
         """
-        cmd = (f"gluster snapshot deactivate {snapname} --mode=script --xml")
+        cmd = _CMD_SNAP_DEACTIVATE.format(snap=snapname)
         return self.execute_abstract_op_node(cmd, node, excep)
 
     def terminate_snapd_on_node(self, node: str) -> dict:
@@ -893,7 +1205,8 @@ class SnapshotOps(AbstractOps):
         if volname is None:
             volname = ""
 
-        cmd = (f"gluster snapshot config {volname} {list(option.keys())[0]}"
-               f" {list(option.values())[0]} --mode=script --xml")
+        cmd = _CMD_SNAP_CONFIG_SET.format(vol=volname,
+                                          opt=list(option.keys())[0],
+                                          val=list(option.values())[0])
 
         return self.execute_abstract_op_node(cmd, node, excep)
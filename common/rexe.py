@@ -3,6 +3,7 @@ import time
 import random
 import concurrent.futures
 import json
+import threading
 import paramiko
 import xmltodict
 from multipledispatch import dispatch
@@ -14,6 +15,12 @@ class Rexe:
         self.host_dict = {**client_dict, **server_dict}
         self.server_dict = server_dict
         self.client_dict = client_dict
+        # Sequence of commands run, for the query caches to know if the
+        # cluster might have changed since their lookup. It is bumped under
+        # a lock as the commands can be run from multiple threads.
+        self._op_seq = 0
+        self._op_seq_lock = threading.Lock()
+        self._query_cache = {}
 
     def _random_node(self):
         """
@@ -104,6 +111,9 @@ class Rexe:
         if not self.connect_flag:
             ret_dict['Flag'] = False
             return ret_dict
+
+        with self._op_seq_lock:
+            self._op_seq += 1
         try:
             _, stdout, stderr = self.node_dict[node].exec_command(cmd)
         except Exception:
@@ -164,6 +174,9 @@ class Rexe:
 
         if not self.connect_flag:
             return async_obj
+
+        with self._op_seq_lock:
+            self._op_seq += 1
         try:
             stdin, stdout, stderr = self.node_dict[node].exec_command(cmd)
         except Exception:
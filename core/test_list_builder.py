@@ -8,16 +8,16 @@ to be executed in the current session.
 
 """
 import os
-import inspect
-import importlib
-import copy
+import json
 import sys
-from comment_parser.comment_parser import extract_comments
+import concurrent.futures
 
 
 valid_vol_types = ['rep', 'dist', 'arb', 'disp', 'dist-rep', 'dist-arb',
                    'dist-disp', "Generic"]
 
+test_cache_file = ".redant_test_cache.json"
+
 
 class TestListBuilder:
     """
@@ -26,22 +26,11 @@ class TestListBuilder:
     TC related data to the test_runner.
     """
     excluded_tests: list = []
-    tests_path_list = []
-    r_ndtest_list = []
-    dt_ndtest_list = []
-    dtr_ndtest_list = []
-    a_ndtest_list = []
-    dta_ndtest_list = []
-    ds_ndtest_list = []
-    dtds_ndtest_list = []
-    gen_ndtest_list = []
-    dtest_list = []
-    test_nd_volc_dict = {}
-    test_nd_vold_dict = {}
-    nd_category = {'rep': r_ndtest_list, 'dist': dt_ndtest_list,
-                   'arb': a_ndtest_list, 'disp': ds_ndtest_list,
-                   'dist-rep': dtr_ndtest_list, 'dist-arb': dta_ndtest_list,
-                   'dist-disp': dtds_ndtest_list, 'Generic': gen_ndtest_list}
+    tests_path_list: list = []
+    dtest_list: list = []
+    test_nd_volc_dict: dict = {}
+    test_nd_vold_dict: dict = {}
+    nd_category: dict = {vol_type: [] for vol_type in valid_vol_types}
 
     @classmethod
     def create_test_dict(cls, path: str, excluded_tests: list,
@@ -56,54 +45,85 @@ class TestListBuilder:
             of the complete suite.
         Returns:
         """
-        def path_error_handler(exception_instance):
-            raise FileNotFoundError
-
         global valid_vol_types
+        # Every call builds fresh lists so that the TCs of a previous
+        # call aren't processed again.
+        tests_path_list = []
+        dtest_list = []
+        nd_category = {vol_type: [] for vol_type in valid_vol_types}
+
         # Obtaining list of paths to the TCs under given directory.
+        tests_stat = {}
         if not single_tc:
-            for root, _, files in os.walk(path, onerror=path_error_handler):
-                for tfile in files:
-                    if tfile.endswith(".py") and tfile.startswith("test"):
-                        test_case_path = os.path.join(root, tfile)
-                        if test_case_path not in excluded_tests:
-                            cls.tests_path_list.append(test_case_path)
-
+            cls._scan_test_files(path, excluded_tests, tests_stat)
         elif path not in excluded_tests:
-            cls.tests_path_list.append(path)
+            tests_stat[path] = os.stat(path)
+        tests_path_list.extend(tests_stat)
+
+        # Only the TCs changed since the last session have their flags read
+        # and their class looked up again. The TC modules are still imported
+        # below, as the runner needs the class objects.
+        test_cache = cls._load_test_cache()
+        cache_misses = [tc_path for (tc_path, tc_stat) in tests_stat.items()
+                        if not cls._is_cache_valid(test_cache.get(tc_path),
+                                                   tc_stat)]
+        test_classes = {}
+        if cache_misses:
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                entries = executor.map(cls._create_cache_entry, cache_misses)
+                for (tc_path, (entry, tc_class)) in zip(cache_misses,
+                                                        entries):
+                    entry["mtime"] = tests_stat[tc_path].st_mtime_ns
+                    entry["size"] = tests_stat[tc_path].st_size
+                    test_cache[tc_path] = entry
+                    test_classes[tc_path] = tc_class
+
+        # Entries of the TCs outside this scan are kept, unless the TC file
+        # doesn't exist anymore.
+        removed_tcs = [tc_path for tc_path in test_cache
+                       if tc_path not in tests_stat
+                       and not os.path.exists(tc_path)]
+        for tc_path in removed_tcs:
+            del test_cache[tc_path]
+        if cache_misses or removed_tcs:
+            cls._dump_test_cache(test_cache)
 
         # Extracting the test case flags and adding module level info.
-        for test_case_path in cls.tests_path_list:
-            test_flags = cls._get_test_module_info(test_case_path)
-            test_dict = {}
-            test_dict["modulePath"] = test_case_path
-            test_dict["moduleName"] = test_case_path.split("/")[-1]
-            test_dict["componentName"] = test_case_path.split("/")[-2]
-            test_dict["testClass"] = cls._get_test_class(test_case_path)
-            test_dict["testType"] = test_case_path.split("/")[-3]
-            test_dict["tcNature"] = test_flags["tcNature"]
-            if test_flags["tcNature"] == "disruptive":
-                for vol_type in test_flags["volType"]:
-                    if vol_type not in valid_vol_types:
-                        raise Exception(f"{test_dict['modulePath']} has"
-                                        f" invalid volume type {vol_type}")
-                    temp_test_dict = copy.deepcopy(test_dict)
-                    temp_test_dict["volType"] = copy.deepcopy(vol_type)
-                    cls.dtest_list.append(temp_test_dict)
-            elif test_flags["tcNature"] == "nonDisruptive":
-                for vol_type in test_flags["volType"]:
-                    if vol_type not in valid_vol_types:
-                        raise Exception(f"{test_dict['modulePath']} has"
-                                        f" invalid volume type {vol_type}")
-                    temp_test_dict = copy.deepcopy(test_dict)
-                    cls.nd_category[vol_type].append(temp_test_dict)
-            else:
+        for test_case_path in tests_path_list:
+            test_flags = test_cache[test_case_path]
+            tc_nature = test_flags["tcNature"]
+            if tc_nature not in ("disruptive", "nonDisruptive"):
                 raise Exception(f"Invalid test nature : "
-                                f" {test_flags['tcNature']}")
+                                f" {tc_nature}")
+            path_parts = test_case_path.rsplit("/", 3)
+            test_class = test_classes.get(test_case_path)
+            if test_class is None:
+                test_class = cls._load_test_class(test_flags["testClass"])
+            for vol_type in test_flags["volType"]:
+                if vol_type not in valid_vol_types:
+                    raise Exception(f"{test_case_path} has"
+                                    f" invalid volume type {vol_type}")
+                test_dict = {"modulePath": test_case_path,
+                             "moduleName": path_parts[-1],
+                             "componentName": path_parts[-2],
+                             "testClass": test_class,
+                             "testType": path_parts[-3],
+                             "tcNature": tc_nature}
+                if tc_nature == "disruptive":
+                    test_dict["volType"] = vol_type
+                    dtest_list.append(test_dict)
+                else:
+                    nd_category[vol_type].append(test_dict)
+
+        cls.tests_path_list = tests_path_list
+        cls.dtest_list = dtest_list
+        cls.nd_category = nd_category
+        cls.test_nd_volc_dict = {}
+        cls.test_nd_vold_dict = {}
 
         cls.spec_vol = []
         nd_tests_count = 0
-        for (vol_t, listv) in cls.nd_category.items():
+        for (vol_t, listv) in nd_category.items():
             if vol_t == "Generic":
                 continue
             nd_tests_count += len(listv)
@@ -112,6 +132,112 @@ class TestListBuilder:
         if nd_tests_count > 0:
             cls._create_nd_special_tests()
 
+    @classmethod
+    def _scan_test_files(cls, path: str, excluded_tests: list,
+                         tests_stat: dict):
+        """
+        Method to recursively collect the TC paths under a directory
+        along with their stat results.
+        Args:
+            path (str): The directory path to be scanned.
+            excluded_tests (list): TC paths which are to be skipped.
+            tests_stat (dict): The TC path to stat result mapping which
+            is populated by this method.
+        """
+        try:
+            with os.scandir(path) as dir_iter:
+                entries = list(dir_iter)
+        except OSError as exc:
+            raise FileNotFoundError(path) from exc
+
+        sub_dirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                sub_dirs.append(entry.path)
+            elif (entry.name.endswith(".py")
+                  and entry.name.startswith("test")
+                  and entry.path not in excluded_tests):
+                tests_stat[entry.path] = entry.stat()
+        for sub_dir in sub_dirs:
+            cls._scan_test_files(sub_dir, excluded_tests, tests_stat)
+
+    @classmethod
+    def _load_test_cache(cls) -> dict:
+        """
+        Method to load the TC details cached by the previous sessions.
+        Returns:
+            dict of TC path to its cached details, empty dict if the
+            cache is absent or unreadable.
+        """
+        try:
+            with open(test_cache_file, 'r') as cache_fd:
+                test_cache = json.load(cache_fd)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(test_cache, dict):
+            return {}
+        return test_cache
+
+    @classmethod
+    def _dump_test_cache(cls, test_cache: dict):
+        """
+        Method to persist the TC details for the next sessions. Failure
+        to write the cache isn't fatal, it'll be rebuilt next time.
+        Args:
+            test_cache (dict): TC path to its details mapping.
+        """
+        try:
+            with open(test_cache_file, 'w') as cache_fd:
+                json.dump(test_cache, cache_fd)
+        except OSError:
+            pass
+
+    @classmethod
+    def _is_cache_valid(cls, entry: dict, tc_stat) -> bool:
+        """
+        Method to check if the cached entry still matches the TC file.
+        Args:
+            entry (dict): Cached details of the TC or None.
+            tc_stat (os.stat_result): Current stat of the TC file.
+        Returns:
+            bool: True if the entry can be used as is, else False.
+        """
+        return (entry is not None
+                and entry.get("mtime") == tc_stat.st_mtime_ns
+                and entry.get("size") == tc_stat.st_size)
+
+    @classmethod
+    def _create_cache_entry(cls, tc_path: str) -> tuple:
+        """
+        Method to parse the TC flags and resolve the TC class which
+        are to be cached.
+        Args:
+            tc_path (str): The path of the test case.
+        Returns:
+            tuple: The cache entry, a dict with keys tcNature, volType and
+            testClass, wherein the testClass is the fully qualified name of
+            the TC class. And the resolved TC class itself.
+        """
+        entry = cls._get_test_module_info(tc_path)
+        tc_class = cls._get_test_class(tc_path)
+        entry["testClass"] = f"{tc_class.__module__}.{tc_class.__name__}"
+        return (entry, tc_class)
+
+    @classmethod
+    def _load_test_class(cls, tc_class_path: str):
+        """
+        Method to obtain the TC class from its fully qualified name.
+        Args:
+            tc_class_path (str): module path and the class name joined
+            by a '.'
+        """
+        import importlib  # pylint: disable=import-outside-toplevel
+        tc_module_str, tc_class_str = tc_class_path.rsplit(".", 1)
+        if "." not in sys.path:
+            sys.path.insert(1, ".")
+        tc_module = importlib.import_module(tc_module_str)
+        return getattr(tc_module, tc_class_str)
+
     @classmethod
     def get_spec_vol_types(cls):
         """
@@ -214,7 +340,15 @@ class TestListBuilder:
                         "volType" : [replicated, ...]
                       }
         """
-        flags = str(extract_comments(tc_path, mime="text/x-python")[0])
+        # Only the first comment line holds the flags, hence reading
+        # till that line suffices.
+        flags = ''
+        with open(tc_path, 'rb') as tc_fd:
+            for line in tc_fd:
+                line = line.lstrip()
+                if line.startswith(b'#'):
+                    flags = line[1:].decode().strip()
+                    break
         tc_flags = {}
         tc_flags["tcNature"] = flags.split(';')[0].strip()
         tc_flags["volType"] = flags.split(';')[1].split(',')
@@ -228,10 +362,14 @@ class TestListBuilder:
         Method to import the module and inspect the class to be stored
         for creating objects later.
         """
+        import importlib  # pylint: disable=import-outside-toplevel
+        import inspect  # pylint: disable=import-outside-toplevel
         tc_module_str = tc_path.replace("/", ".")[:-3]
-        sys.path.insert(1, ".")
+        if "." not in sys.path:
+            sys.path.insert(1, ".")
         tc_module = importlib.import_module(tc_module_str)
-        tc_class_str = inspect.getmembers(tc_module,
-                                          inspect.isclass)[1][0]
-        tc_class = getattr(tc_module, tc_class_str)
-        return tc_class
+        for tc_class in vars(tc_module).values():
+            if (inspect.isclass(tc_class)
+                    and tc_class.__module__ == tc_module.__name__):
+                return tc_class
+        raise Exception(f"No test class found in {tc_path}")
@@ -96,5 +96,5 @@ class TestCase(DParentTest):
         snap_running_status = redant.is_snapd_running(self.vol_name,
                                                       self.server_list[0])
         redant.logger.info(f"Snapd run status : {snap_running_status}")
-        redant.snap_delete(self.snap_name, self.server_list[0])
-        redant.snap_delete(self.snap_name2, self.server_list[0])
+        redant.snap_delete_many([self.snap_name, self.snap_name2],
+                                self.server_list[0])
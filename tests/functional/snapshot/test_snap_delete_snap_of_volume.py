@@ -48,9 +48,9 @@ class TestCase(DParentTest):
                                self.server_list[0])
 
         # deleting snapshot with snap name
-        for snap_count in range(0, 3):
-            self.snap_name = f"{self.vol_name}-snap{snap_count}"
-            redant.snap_delete(self.snap_name, self.server_list[0])
+        snapnames = [f"{self.vol_name}-snap{snap_count}"
+                     for snap_count in range(0, 3)]
+        redant.snap_delete_many(snapnames, self.server_list[0])
 
         # delete all snapshot of volume
         redant.snap_delete_by_volumename(self.vol_name, self.server_list[0])